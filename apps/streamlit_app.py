@@ -1,4 +1,6 @@
+import functools
 import time
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timezone
 from pathlib import Path
 import sys
@@ -9,13 +11,15 @@ ROOT_DIR = Path(__file__).resolve().parents[1]
 if str(ROOT_DIR) not in sys.path:
     sys.path.insert(0, str(ROOT_DIR))
 
+from tenancy_assistant import _disk_cache
 from tenancy_assistant.genai_assistant import (
     get_public_ip_summary,
     get_cost_summary,
     get_cloud_guard_summary,
-    chat_with_public_ip_using_cached_result,
-    chat_with_cost_using_cached_result,
-    chat_with_cloud_guard_using_cached_result,
+    stream_chat_with_public_ip_using_cached_result,
+    stream_chat_with_cost_using_cached_result,
+    stream_chat_with_cloud_guard_using_cached_result,
+    stream_chat_unified,
 )
 
 # --------- PAGE CONFIG & BASIC STYLE ---------
@@ -25,9 +29,12 @@ st.set_page_config(
     layout="wide",
 )
 
-# Custom CSS to make things look nicer
-st.markdown(
-    """
+# Custom CSS to make things look nicer. Built once per server process via
+# st.cache_resource so reruns reuse the same string instead of
+# reallocating a multi-KB literal every time.
+@st.cache_resource
+def _css() -> str:
+    return """
     <style>
     /* Global */
     .block-container {
@@ -108,9 +115,10 @@ st.markdown(
         margin-bottom: 0.4rem;
     }
     </style>
-    """,
-    unsafe_allow_html=True,
-)
+    """
+
+
+st.markdown(_css(), unsafe_allow_html=True)
 
 # --------- HEADER ---------
 st.markdown(
@@ -128,60 +136,395 @@ st.markdown(
 # --------- MODE SELECTION ---------
 mode = st.radio(
     "View",
-    options=["Public IPs", "Cost", "Cloud Guard"],
+    options=["Public IPs", "Cost", "Cloud Guard", "All"],
     horizontal=True,
     index=0,
 )
 
 
-# --------- CACHE HELPERS ---------
+# --------- GENAI CLIENT (BUILT ONCE PER SERVER) ---------
+
+@st.cache_resource
+def _genai_client():
+    from tenancy_assistant.genai_assistant import get_genai_client
+
+    return get_genai_client()
+
+
+# --------- DATE RANGE HELPERS ---------
+
+@functools.lru_cache(maxsize=8)
+def _date_range_for_preset(preset_name: str, today_iso: str):
+    now = datetime.now(timezone.utc)
+    first_of_this_month = now.replace(
+        day=1, hour=0, minute=0, second=0, microsecond=0
+    )
+
+    if preset_name == "Last full month":
+        # End = first day of this month (exclusive end)
+        end = first_of_this_month
+
+        # Start = first day of previous month
+        if first_of_this_month.month == 1:
+            start = first_of_this_month.replace(
+                year=first_of_this_month.year - 1, month=12
+            )
+        else:
+            start = first_of_this_month.replace(
+                month=first_of_this_month.month - 1, day=1
+            )
+    else:  # "Current month"
+        start = first_of_this_month
+        end = now.replace(hour=0, minute=0, second=0, microsecond=0)
+
+    return start.isoformat(), end.isoformat()
+
+
+def get_date_range_for_preset(preset_name: str):
+    """
+    Date window for a cost preset, memoized per (preset, UTC day).
+
+    Both window ends are already snapped to midnight UTC, so the result —
+    and therefore every cache key derived from it — is stable for a full
+    day instead of changing between reruns.
+    """
+    today_iso = datetime.now(timezone.utc).date().isoformat()
+    return _date_range_for_preset(preset_name, today_iso)
+
+
+# --------- CACHE HELPERS (STALE-WHILE-REVALIDATE) ---------
+
+# After SOFT_TTL the stale snapshot is still served immediately, but a
+# background refresh is kicked off; only past HARD_TTL do we block the
+# user on a fresh OCI round trip.
+SNAPSHOT_SOFT_TTL_SEC = 1500  # ~25 minutes
+SNAPSHOT_HARD_TTL_SEC = 3 * 3600  # 3 hours
+
+
+@st.cache_resource
+def _refresh_executor():
+    return ThreadPoolExecutor(max_workers=3)
+
+
+@st.cache_resource
+def _snapshot_store() -> dict:
+    # Snapshots are tenancy-wide (every session sees the same data), so
+    # they live in one process-wide dict rather than st.session_state.
+    # Crucially, session_state resolves its ScriptRunContext thread-
+    # locally: a background refresh worker has no context, so its writes
+    # would land in a throwaway bare-mode session and never reach the
+    # user. A plain shared dict is safe from any thread.
+    return {}
+
+
+def _get_snapshot_swr(state_key: str, fetch_fn):
+    """
+    Stale-while-revalidate snapshot lookup keyed into the process-wide
+    snapshot store.
+
+    Fresh or mildly stale snapshots are returned immediately; a snapshot
+    past the soft TTL additionally triggers one background refresh that
+    swaps in the new value on a later rerun. Only a missing or hard-expired
+    snapshot makes the caller wait on OCI.
+    """
+    store = _snapshot_store()
+    now = time.time()
+    snapshot = store.get(state_key)
+    if snapshot is not None and now - snapshot["fetched_at"] > SNAPSHOT_HARD_TTL_SEC:
+        snapshot = None
+
+    if snapshot is None:
+        snapshot = fetch_fn()
+        store[state_key] = snapshot
+        return snapshot
+
+    refreshing_key = f"{state_key}:refreshing"
+    if (
+        now - snapshot["fetched_at"] > SNAPSHOT_SOFT_TTL_SEC
+        and not store.get(refreshing_key)
+    ):
+        store[refreshing_key] = True
+
+        def _refresh():
+            try:
+                store[state_key] = fetch_fn()
+            finally:
+                store[refreshing_key] = False
+
+        _refresh_executor().submit(_refresh)
+
+    return snapshot
+
+
+def _fetch_snapshot_via_disk(fn_name: str, params: dict, fetch_fn):
+    """
+    Back an MCP snapshot fetch with the on-disk cache, so a fresh
+    `streamlit run` (or a recycled worker) reuses a recent snapshot
+    instead of re-hitting OCI on every cold boot.
+    """
+    def _fetch():
+        return {
+            "data": fetch_fn(params),
+            "fetched_at": time.time(),
+        }
+
+    return _disk_cache.get_or_compute(
+        _disk_cache.make_key(fn_name, params),
+        SNAPSHOT_SOFT_TTL_SEC,
+        _fetch,
+    )
+
+
+def _fetch_public_ip_snapshot():
+    return _fetch_snapshot_via_disk(
+        "public_ip", {"scope": "ALL"}, get_public_ip_summary
+    )
+
+
+def _fetch_cost_snapshot(time_start: str, time_end: str):
+    return _fetch_snapshot_via_disk(
+        "cost",
+        {
+            "granularity": "MONTHLY",
+            "group_by": "COMPARTMENT",
+            "time_start": time_start,
+            "time_end": time_end,
+        },
+        get_cost_summary,
+    )
+
+
+def _fetch_cloud_guard_snapshot(include_endpoints: bool):
+    return _fetch_snapshot_via_disk(
+        "cloud_guard",
+        {
+            "include_endpoints": include_endpoints,
+            "max_problems": 10,
+            "max_endpoints_per_problem": 10,
+        },
+        get_cloud_guard_summary,
+    )
+
 
-@st.cache_data(ttl=1800)  # 30 minutes cache
 def get_cached_public_ip_summary():
-    data = get_public_ip_summary({"scope": "ALL"})
-    return {
-        "data": data,
-        "fetched_at": time.time(),
-    }
+    return _get_snapshot_swr("snap_public_ip", _fetch_public_ip_snapshot)
 
 
-@st.cache_data(ttl=1800)  # 30 minutes cache
 def get_cached_cost_summary(time_start: str, time_end: str):
-    data = get_cost_summary({
-        "granularity": "MONTHLY",
-        "group_by": "COMPARTMENT",
-        "time_start": time_start,
-        "time_end": time_end,
-    })
-    return {
-        "data": data,
-        "fetched_at": time.time(),
-    }
+    return _get_snapshot_swr(
+        f"snap_cost:{time_start}:{time_end}",
+        lambda: _fetch_cost_snapshot(time_start, time_end),
+    )
+
 
-@st.cache_data(ttl=1800)  # 30 minutes cache
 def get_cached_cloud_guard_summary(include_endpoints: bool = True):
-    data = get_cloud_guard_summary({
-        "include_endpoints": include_endpoints,
-        "max_problems": 10,
-        "max_endpoints_per_problem": 10,
-    })
-    return {
-        "data": data,
-        "fetched_at": time.time(),
-    }
+    return _get_snapshot_swr(
+        f"snap_cloud_guard:{include_endpoints}",
+        lambda: _fetch_cloud_guard_snapshot(include_endpoints),
+    )
+
+
+# --------- INFO-CARD RENDERING (MEMOIZED) ---------
+# Streamlit reruns the whole script on every chat keystroke; memoizing the
+# card HTML on the snapshot contents means typing doesn't re-stringify the
+# same summary over and over.
+
+@st.cache_data(show_spinner=False)
+def _render_public_ip_card(snapshot) -> str:
+    summary = snapshot["data"]
+    fetched_dt = datetime.fromtimestamp(snapshot["fetched_at"]).strftime("%Y-%m-%d %H:%M:%S")
+    total_count = summary.get("total_count", "-")
+    by_scope = summary.get("by_scope", {})
+    eph = by_scope.get("EPHEMERAL", "-")
+    resv = by_scope.get("RESERVED", "-")
+
+    return f"""
+        <div class="info-card">
+            <h4>Current public IP snapshot</h4>
+            <div class="info-metric">
+                <span>Total public IPs</span>
+                <span class="value">{total_count}</span>
+            </div>
+            <div class="info-metric">
+                <span>Ephemeral</span>
+                <span class="value">{eph}</span>
+            </div>
+            <div class="info-metric">
+                <span>Reserved</span>
+                <span class="value">{resv}</span>
+            </div>
+            <div style="margin-top:0.55rem; font-size:0.8rem; opacity:0.8;">
+                Snapshot time: <code>{fetched_dt}</code> (approximate)
+            </div>
+            <div style="margin-top:0.35rem; font-size:0.78rem; opacity:0.75;">
+                Data refreshes in the background after ~25 minutes; you always see the latest cached snapshot instantly.
+            </div>
+        </div>
+        """
+
+
+@st.cache_data(show_spinner=False)
+def _render_cost_card(snapshot, preset: str) -> str:
+    summary = snapshot["data"]
+    fetched_dt = datetime.fromtimestamp(snapshot["fetched_at"]).strftime("%Y-%m-%d %H:%M:%S")
+    total_cost = summary.get("total_cost", "-")
+    currency = summary.get("currency", "").strip() or "USD"
+    time_start_str = summary.get("time_start", "")
+    time_end_str = summary.get("time_end", "")
+    group_by = summary.get("group_by", "COMPARTMENT")
+    items = summary.get("items", [])
+
+    return (
+        f"""
+        <div class="info-card">
+            <h4>Cost snapshot ({preset})</h4>
+            <div class="info-metric">
+                <span>Total cost ({group_by.lower()})</span>
+                <span class="value">{currency} {total_cost}</span>
+            </div>
+            <div class="info-metric">
+                <span>Window</span>
+                <span class="value">{time_start_str[:10]} -> {time_end_str[:10]}</span>
+            </div>
+            <div style="margin-top:0.55rem; font-size:0.85rem;">
+                Top compartments:
+            </div>
+        """
+        + "".join(
+            f"""
+            <div class="info-metric">
+                <span>{item.get('label', item.get('key', 'UNKNOWN'))}</span>
+                <span class="value">{currency} {item.get('cost', 0)}</span>
+            </div>
+            """
+            for item in items[:3]
+        )
+        + f"""
+            <div style="margin-top:0.55rem; font-size:0.8rem; opacity:0.8;">
+                Snapshot time: <code>{fetched_dt}</code> (approximate)
+            </div>
+            <div style="margin-top:0.35rem; font-size:0.78rem; opacity:0.75;">
+                Data refreshes in the background after ~25 minutes; you always see the latest cached snapshot instantly.
+            </div>
+        </div>
+        """
+    )
+
+
+@st.cache_data(show_spinner=False)
+def _render_cloud_guard_card(snapshot) -> str:
+    summary = snapshot["data"]
+    fetched_dt = datetime.fromtimestamp(snapshot["fetched_at"]).strftime("%Y-%m-%d %H:%M:%S")
+    total_targets = summary.get("total_targets", "-")
+    total_problems = summary.get("total_problems", "-")
+    by_risk = summary.get("problems_by_risk", {})
+
+    # One sort + one join per snapshot; the memoized result is then reused
+    # verbatim on every rerun until the snapshot changes.
+    risk_rows = "".join(
+        f"""
+            <div class="info-metric">
+                <span>{risk}</span>
+                <span class="value">{count}</span>
+            </div>
+        """
+        for risk, count in sorted(by_risk.items())
+    )
+
+    return f"""
+        <div class="info-card">
+            <h4>Cloud Guard snapshot</h4>
+            <div class="info-metric">
+                <span>Total targets</span>
+                <span class="value">{total_targets}</span>
+            </div>
+            <div class="info-metric">
+                <span>Total problems</span>
+                <span class="value">{total_problems}</span>
+            </div>
+            <div style="margin-top:0.55rem; font-size:0.85rem;">
+                Problems by risk:
+            </div>
+            {risk_rows}
+            <div style="margin-top:0.55rem; font-size:0.8rem; opacity:0.8;">
+                Snapshot time: <code>{fetched_dt}</code> (approximate)
+            </div>
+            <div style="margin-top:0.35rem; font-size:0.78rem; opacity:0.75;">
+                Data refreshes in the background after ~25 minutes; you always see the latest cached snapshot instantly.
+            </div>
+        </div>
+        """
+
+
+# --------- ANSWER CACHE ---------
+# Demo users often repeat a question verbatim. Answers are keyed on
+# (mode, question, snapshot fetched_at), so a repeat against the same
+# snapshot replays instantly with zero GenAI calls, while any new
+# snapshot naturally invalidates the entry.
+ANSWER_CACHE_TTL_SEC = 1800
+
+
+@st.cache_resource
+def _answer_cache() -> dict:
+    return {}
+
+
+def _lookup_cached_answer(key):
+    entry = _answer_cache().get(key)
+    if entry is not None and time.time() - entry[1] < ANSWER_CACHE_TTL_SEC:
+        return entry[0]
+    return None
+
+
+def _store_cached_answer(key, answer: str):
+    cache = _answer_cache()
+    if len(cache) > 512:
+        cache.clear()
+    cache[key] = (answer, time.time())
+
+
+def _preload_all(time_start: str, time_end: str):
+    """
+    Warm all three snapshot caches in parallel, so cold-start latency is
+    roughly the slowest single OCI call instead of the sum of all three.
+    """
+    # Materialize the shared store on the script thread so the workers
+    # (which have no ScriptRunContext) only ever do plain dict access.
+    _snapshot_store()
+    with ThreadPoolExecutor(max_workers=3) as ex:
+        futures = [
+            ex.submit(get_cached_public_ip_summary),
+            ex.submit(get_cached_cost_summary, time_start, time_end),
+            ex.submit(get_cached_cloud_guard_summary, False),
+        ]
+        return [f.result() for f in futures]
 
 
 # --------- SESSION STATE ---------
 if "history" not in st.session_state:
     # history is per-mode: {"Public IPs": [...], "Cost": [...]}
-    st.session_state.history = {"Public IPs": [], "Cost": [], "Cloud Guard": []}
+    st.session_state.history = {"Public IPs": [], "Cost": [], "Cloud Guard": [], "All": []}
+st.session_state.history.setdefault(mode, [])
 
+# Only this many most-recent messages are replayed on each rerun; older
+# ones sit behind an expander so long demo sessions don't pay O(history)
+# markdown parsing per keystroke.
+MAX_VISIBLE_CHAT_MESSAGES = 50
 
-# --------- LAYOUT: TWO COLUMNS ---------
-left_col, right_col = st.columns([1.1, 2.2])
 
-# --------- LEFT COLUMN: SNAPSHOT INFO + TIPS ---------
-with left_col:
+# --------- WARM ALL SNAPSHOTS ---------
+if st.button("Warm all snapshots"):
+    warm_start, warm_end = get_date_range_for_preset("Current month")
+    with st.spinner("Warming public IP, cost, and Cloud Guard snapshots in parallel..."):
+        _preload_all(warm_start, warm_end)
+    st.success("All snapshots cached. Questions in every mode will now be faster.")
+
+
+# --------- LEFT PANE: SNAPSHOT INFO + TIPS ---------
+# Each pane is a fragment so a chat keystroke reruns only the chat pane;
+# the snapshot pane (cache lookups, card HTML, date math) stays untouched.
+@st.fragment
+def _left_pane(mode: str):
     if mode == "Public IPs":
         st.subheader("Public IP snapshot")
 
@@ -192,39 +535,7 @@ with left_col:
 
         try:
             snapshot = get_cached_public_ip_summary()
-            summary = snapshot["data"]
-            fetched_dt = datetime.fromtimestamp(snapshot["fetched_at"]).strftime("%Y-%m-%d %H:%M:%S")
-            total_count = summary.get("total_count", "-")
-            by_scope = summary.get("by_scope", {})
-            eph = by_scope.get("EPHEMERAL", "-")
-            resv = by_scope.get("RESERVED", "-")
-
-            st.markdown(
-                f"""
-                <div class="info-card">
-                    <h4>Current public IP snapshot</h4>
-                    <div class="info-metric">
-                        <span>Total public IPs</span>
-                        <span class="value">{total_count}</span>
-                    </div>
-                    <div class="info-metric">
-                        <span>Ephemeral</span>
-                        <span class="value">{eph}</span>
-                    </div>
-                    <div class="info-metric">
-                        <span>Reserved</span>
-                        <span class="value">{resv}</span>
-                    </div>
-                    <div style="margin-top:0.55rem; font-size:0.8rem; opacity:0.8;">
-                        Snapshot time: <code>{fetched_dt}</code> (approximate)
-                    </div>
-                    <div style="margin-top:0.35rem; font-size:0.78rem; opacity:0.75;">
-                        Data is cached for ~10 minutes to keep responses fast.
-                    </div>
-                </div>
-                """,
-                unsafe_allow_html=True,
-            )
+            st.markdown(_render_public_ip_card(snapshot), unsafe_allow_html=True)
         except Exception as e:
             st.markdown(
                 f"""
@@ -264,33 +575,10 @@ with left_col:
             index=0,
         )
 
-        def get_date_range_for_preset(preset_name: str):
-            now = datetime.now(timezone.utc)
-            first_of_this_month = now.replace(
-                day=1, hour=0, minute=0, second=0, microsecond=0
-            )
-
-            if preset_name == "Last full month":
-                # End = first day of this month (exclusive end)
-                end = first_of_this_month
-
-                # Start = first day of previous month
-                if first_of_this_month.month == 1:
-                    start = first_of_this_month.replace(
-                        year=first_of_this_month.year - 1, month=12
-                    )
-                else:
-                    start = first_of_this_month.replace(
-                        month=first_of_this_month.month - 1, day=1
-                    )
-            else:  # "Current month"
-                start = first_of_this_month
-                end = now.replace(hour=0, minute=0, second=0, microsecond=0)
-
-            return start.isoformat(), end.isoformat()
-
-        # Compute time window based on user selection
+        # Compute time window based on user selection and publish it for
+        # the chat fragment, which reruns independently of this one.
         time_start, time_end = get_date_range_for_preset(preset)
+        st.session_state["cost_window"] = (preset, time_start, time_end)
 
         # ---- PRELOAD BUTTON ----
         if st.button("Preload cost snapshot"):
@@ -301,54 +589,7 @@ with left_col:
         # ---- SHOW SNAPSHOT ----
         try:
             snapshot = get_cached_cost_summary(time_start, time_end)
-            summary = snapshot["data"]
-            fetched_dt = datetime.fromtimestamp(snapshot["fetched_at"]).strftime(
-                "%Y-%m-%d %H:%M:%S"
-            )
-
-            total_cost = summary.get("total_cost", "-")
-            currency = summary.get("currency", "").strip() or "USD"
-            time_start_str = summary.get("time_start", "")
-            time_end_str = summary.get("time_end", "")
-            group_by = summary.get("group_by", "COMPARTMENT")
-            items = summary.get("items", [])
-
-            st.markdown(
-                f"""
-                <div class="info-card">
-                    <h4>Cost snapshot ({preset})</h4>
-                    <div class="info-metric">
-                        <span>Total cost ({group_by.lower()})</span>
-                        <span class="value">{currency} {total_cost}</span>
-                    </div>
-                    <div class="info-metric">
-                        <span>Window</span>
-                        <span class="value">{time_start_str[:10]} -> {time_end_str[:10]}</span>
-                    </div>
-                    <div style="margin-top:0.55rem; font-size:0.85rem;">
-                        Top compartments:
-                    </div>
-                """
-                + "".join(
-                    f"""
-                    <div class="info-metric">
-                        <span>{item.get('label', item.get('key', 'UNKNOWN'))}</span>
-                        <span class="value">{currency} {item.get('cost', 0)}</span>
-                    </div>
-                    """
-                    for item in items[:3]
-                )
-                + f"""
-                    <div style="margin-top:0.55rem; font-size:0.8rem; opacity:0.8;">
-                        Snapshot time: <code>{fetched_dt}</code> (approximate)
-                    </div>
-                    <div style="margin-top:0.35rem; font-size:0.78rem; opacity:0.75;">
-                        Data is cached for ~10 minutes to keep responses fast.
-                    </div>
-                </div>
-                """,
-                unsafe_allow_html=True,
-            )
+            st.markdown(_render_cost_card(snapshot, preset), unsafe_allow_html=True)
         except Exception as e:
             st.markdown(
                 f"""
@@ -377,7 +618,7 @@ with left_col:
             - Mention that data comes from OCI Usage API via your MCP cost tool.
             """
         )
-    else:  # mode == "Cloud Guard"
+    elif mode == "Cloud Guard":
         st.subheader("Cloud Guard snapshot")
 
         if st.button("Preload Cloud Guard snapshot"):
@@ -387,48 +628,7 @@ with left_col:
 
         try:
             snapshot = get_cached_cloud_guard_summary(include_endpoints=False)
-            summary = snapshot["data"]
-            fetched_dt = datetime.fromtimestamp(snapshot["fetched_at"]).strftime("%Y-%m-%d %H:%M:%S")
-            total_targets = summary.get("total_targets", "-")
-            total_problems = summary.get("total_problems", "-")
-            by_risk = summary.get("problems_by_risk", {})
-
-            st.markdown(
-                f"""
-                <div class="info-card">
-                    <h4>Cloud Guard snapshot</h4>
-                    <div class="info-metric">
-                        <span>Total targets</span>
-                        <span class="value">{total_targets}</span>
-                    </div>
-                    <div class="info-metric">
-                        <span>Total problems</span>
-                        <span class="value">{total_problems}</span>
-                    </div>
-                    <div style="margin-top:0.55rem; font-size:0.85rem;">
-                        Problems by risk:
-                    </div>
-                """
-                + "".join(
-                    f"""
-                    <div class="info-metric">
-                        <span>{risk}</span>
-                        <span class="value">{count}</span>
-                    </div>
-                    """
-                    for risk, count in sorted(by_risk.items())
-                )
-                + f"""
-                    <div style="margin-top:0.55rem; font-size:0.8rem; opacity:0.8;">
-                        Snapshot time: <code>{fetched_dt}</code> (approximate)
-                    </div>
-                    <div style="margin-top:0.35rem; font-size:0.78rem; opacity:0.75;">
-                        Data is cached for ~10 minutes to keep responses fast.
-                    </div>
-                </div>
-                """,
-                unsafe_allow_html=True,
-            )
+            st.markdown(_render_cloud_guard_card(snapshot), unsafe_allow_html=True)
         except Exception as e:
             st.markdown(
                 f"""
@@ -456,14 +656,72 @@ with left_col:
             - Cloud Guard endpoints are pulled from recent problems (sampled).
             """
         )
+    else:  # mode == "All"
+        st.subheader("Tenancy snapshot (all datasets)")
+
+        time_start, time_end = get_date_range_for_preset("Current month")
+        st.session_state["all_window"] = (time_start, time_end)
+
+        if st.button("Preload all snapshots"):
+            with st.spinner("Loading all snapshots from OCI in parallel..."):
+                _preload_all(time_start, time_end)
+            st.success("All snapshots cached. Cross-domain questions will now be faster.")
+
+        for render in (
+            lambda: _render_public_ip_card(get_cached_public_ip_summary()),
+            lambda: _render_cost_card(
+                get_cached_cost_summary(time_start, time_end), "Current month"
+            ),
+            lambda: _render_cloud_guard_card(
+                get_cached_cloud_guard_summary(include_endpoints=False)
+            ),
+        ):
+            try:
+                st.markdown(render(), unsafe_allow_html=True)
+            except Exception as e:
+                st.markdown(
+                    f"""
+                    <div class="info-card">
+                        <div style="font-size:0.85rem;">
+                            Snapshot not available yet.
+                        </div>
+                        <div style="margin-top:0.4rem; font-size:0.78rem; opacity:0.7;">
+                            Technical detail: {e}
+                        </div>
+                    </div>
+                    """,
+                    unsafe_allow_html=True,
+                )
 
+        st.markdown("### Tips for your demo (All)")
+        st.markdown(
+            """
+            - Try asking multi-part questions:
+              - *How many public IPs do I have, and which compartment spends the most?*
+              - *Summarize my tenancy: cost, public IPs, and Cloud Guard posture.*
+            - One GenAI call answers across all three datasets.
+            """
+        )
 
-# --------- RIGHT COLUMN: CHAT UI ---------
-with right_col:
+
+# --------- RIGHT PANE: CHAT UI ---------
+@st.fragment
+def _right_pane(mode: str):
     st.subheader(f"Chat with your tenancy ({mode})")
 
-    # Render existing messages for the current mode
-    for msg in st.session_state.history.get(mode, []):
+    # Render existing messages for the current mode; older messages are
+    # collapsed so the hot rerun path only re-parses the recent tail.
+    history = st.session_state.history.get(mode, [])
+    older = history[:-MAX_VISIBLE_CHAT_MESSAGES]
+    recent = history[-MAX_VISIBLE_CHAT_MESSAGES:]
+
+    if older:
+        with st.expander(f"Show older messages ({len(older)})"):
+            for msg in older:
+                with st.chat_message("user" if msg["role"] == "user" else "assistant"):
+                    st.markdown(msg["content"])
+
+    for msg in recent:
         with st.chat_message("user" if msg["role"] == "user" else "assistant"):
             st.markdown(msg["content"])
 
@@ -472,8 +730,10 @@ with right_col:
         placeholder = "Ask something like: How many public IPs do I have?"
     elif mode == "Cost":
         placeholder = "Ask something like: What is my total cost this month?"
-    else:
+    elif mode == "Cloud Guard":
         placeholder = "Ask something like: Show Cloud Guard problems by risk."
+    else:
+        placeholder = "Ask across everything: How many IPs, and which compartment spends the most?"
     user_input = st.chat_input(placeholder)
 
     if user_input:
@@ -482,39 +742,89 @@ with right_col:
         with st.chat_message("user"):
             st.markdown(user_input)
 
-        # Assistant message
+        # Assistant message: stream tokens as they arrive so the first
+        # words appear at time-to-first-token instead of after the full
+        # completion.
         with st.chat_message("assistant"):
             with st.spinner(f"Thinking with OCI GenAI and cached {mode.lower()} data..."):
                 try:
                     if mode == "Public IPs":
                         snapshot = get_cached_public_ip_summary()
                         tool_data = snapshot["data"]
-                        answer = chat_with_public_ip_using_cached_result(
+                        cache_key = (mode, user_input, snapshot["fetched_at"])
+                        stream = stream_chat_with_public_ip_using_cached_result(
                             user_input,
                             tool_data,
+                            client=_genai_client(),
                         )
                     elif mode == "Cost":
-                        time_start, time_end = get_date_range_for_preset(preset)
+                        # Reuse the window the snapshot pane published so
+                        # the cost cache key is identical in both fragments.
+                        preset, time_start, time_end = st.session_state.get(
+                            "cost_window"
+                        ) or ("Current month", *get_date_range_for_preset("Current month"))
                         snapshot = get_cached_cost_summary(time_start, time_end)
                         tool_data = snapshot["data"]
-                        answer = chat_with_cost_using_cached_result(
+                        cache_key = (mode, user_input, snapshot["fetched_at"])
+                        stream = stream_chat_with_cost_using_cached_result(
                             user_input,
                             tool_data,
+                            client=_genai_client(),
                         )
-                    else:  # Cloud Guard
+                    elif mode == "Cloud Guard":
                         snapshot = get_cached_cloud_guard_summary(include_endpoints=True)
                         tool_data = snapshot["data"]
-                        answer = chat_with_cloud_guard_using_cached_result(
+                        cache_key = (mode, user_input, snapshot["fetched_at"])
+                        stream = stream_chat_with_cloud_guard_using_cached_result(
                             user_input,
                             tool_data,
+                            client=_genai_client(),
                         )
+                    else:  # All: one GenAI call over all three digests
+                        time_start, time_end = st.session_state.get(
+                            "all_window"
+                        ) or get_date_range_for_preset("Current month")
+                        ip_snap, cost_snap, cg_snap = _preload_all(time_start, time_end)
+                        cache_key = (
+                            mode,
+                            user_input,
+                            ip_snap["fetched_at"],
+                            cost_snap["fetched_at"],
+                            cg_snap["fetched_at"],
+                        )
+                        stream = stream_chat_unified(
+                            user_input,
+                            {
+                                "getPublicIpSummary": ip_snap["data"],
+                                "getCostSummary": cost_snap["data"],
+                                "getCloudGuardSummary": cg_snap["data"],
+                            },
+                            client=_genai_client(),
+                        )
+
+                    cached_answer = _lookup_cached_answer(cache_key)
+                    if cached_answer is not None:
+                        answer = cached_answer
+                        st.markdown(answer)
+                    else:
+                        answer = str(st.write_stream(stream))
+                        _store_cached_answer(cache_key, answer)
                 except Exception as e:
                     answer = (
                         f"Sorry, something went wrong while querying {mode.lower()} data:\n\n"
                         f"`{e}`"
                     )
-
-                st.markdown(answer)
+                    st.markdown(answer)
 
         # Save assistant answer to history for this mode
         st.session_state.history[mode].append({"role": "assistant", "content": answer})
+
+
+# --------- LAYOUT: TWO COLUMNS ---------
+left_col, right_col = st.columns([1.1, 2.2])
+
+with left_col:
+    _left_pane(mode)
+
+with right_col:
+    _right_pane(mode)
@@ -0,0 +1,87 @@
+"""
+Compact digests of tool results for LLM prompts.
+
+Raw tool payloads (Cloud Guard especially: problems x endpoints) can run
+to tens of KB; every extra token costs tokenization time, model latency,
+and money. These helpers reduce each summary to totals, histograms, and
+a top-k sample — a few KB at most — while recording how much was
+omitted so the model can say "and N more" honestly.
+"""
+
+# How many detail rows each digest keeps.
+TOP_ITEMS = 10
+
+_RISK_ORDER = {"CRITICAL": 0, "HIGH": 1, "MEDIUM": 2, "LOW": 3, "MINOR": 4}
+
+
+def digest_public_ip(d: dict) -> dict:
+    items = d.get("items", [])
+    return {
+        "total_count": d.get("total_count"),
+        "by_scope": d.get("by_scope"),
+        "sample_items": items[:TOP_ITEMS],
+        "items_omitted": max(0, len(items) - TOP_ITEMS),
+    }
+
+
+def digest_cost(d: dict) -> dict:
+    items = sorted(
+        d.get("items", []), key=lambda i: i.get("cost", 0.0), reverse=True
+    )
+    return {
+        "total_cost": d.get("total_cost"),
+        "currency": d.get("currency"),
+        "granularity": d.get("granularity"),
+        "time_start": d.get("time_start"),
+        "time_end": d.get("time_end"),
+        "group_by": d.get("group_by"),
+        "top_items": items[:TOP_ITEMS],
+        "items_omitted": max(0, len(items) - TOP_ITEMS),
+    }
+
+
+def digest_cloud_guard(d: dict) -> dict:
+    problems = sorted(
+        d.get("problems", []),
+        key=lambda p: _RISK_ORDER.get(p.get("risk_level"), len(_RISK_ORDER)),
+    )
+
+    endpoint_summaries = []
+    for entry in d.get("endpoints_by_problem", [])[:TOP_ITEMS]:
+        endpoints = entry.get("endpoints", [])
+        endpoint_summaries.append(
+            {
+                "problem_id": entry.get("problem_id"),
+                "resource_name": entry.get("resource_name"),
+                "risk_level": entry.get("risk_level"),
+                "endpoint_count": len(endpoints),
+                "sample_endpoints": endpoints[:3],
+            }
+        )
+
+    return {
+        "total_targets": d.get("total_targets"),
+        "total_problems": d.get("total_problems"),
+        "problems_by_risk": d.get("problems_by_risk"),
+        "problems_by_lifecycle": d.get("problems_by_lifecycle"),
+        "top_problems": problems[:TOP_ITEMS],
+        "problems_omitted": max(0, len(problems) - TOP_ITEMS),
+        "endpoints_included": d.get("endpoints_included"),
+        "endpoints_by_problem": endpoint_summaries,
+    }
+
+
+_DIGESTERS = {
+    "getPublicIpSummary": digest_public_ip,
+    "getCostSummary": digest_cost,
+    "getCloudGuardSummary": digest_cloud_guard,
+}
+
+
+def digest_for_tool(tool_name: str, d: dict) -> dict:
+    """
+    Digest `d` with the reducer registered for `tool_name`; unknown tools
+    pass through unchanged.
+    """
+    fn = _DIGESTERS.get(tool_name)
+    return fn(d) if fn else d
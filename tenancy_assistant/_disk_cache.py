@@ -0,0 +1,60 @@
+import hashlib
+import json
+import os
+import pickle
+import time
+from pathlib import Path
+
+# Bump this whenever the shape of cached values changes; old entries are
+# simply never looked up again and eventually get overwritten.
+CACHE_VERSION = "v1"
+
+CACHE_DIR = Path(
+    os.environ.get(
+        "OCI_ASSISTANT_CACHE_DIR",
+        os.path.join("~", ".cache", "oci_tenancy_assistant"),
+    )
+).expanduser()
+
+
+def _path_for_key(key: str) -> Path:
+    digest = hashlib.sha256(f"{CACHE_VERSION}:{key}".encode()).hexdigest()
+    return CACHE_DIR / f"{digest}.pkl"
+
+
+def make_key(fn_name: str, params) -> str:
+    """
+    Build a stable cache key from a function name and its JSON-able params.
+    """
+    return json.dumps({"fn": fn_name, "params": params}, sort_keys=True)
+
+
+def get_or_compute(key: str, ttl: int, fn):
+    """
+    Return the cached value for `key` if its file is younger than `ttl`
+    seconds, otherwise call `fn()`, store the result, and return it.
+
+    Cache read/write failures are treated as misses: a corrupt or
+    unwritable cache must never break the actual data fetch.
+    """
+    path = _path_for_key(key)
+
+    try:
+        if path.exists() and time.time() - path.stat().st_mtime < ttl:
+            with path.open("rb") as f:
+                return pickle.load(f)
+    except (OSError, pickle.PickleError, EOFError):
+        pass
+
+    value = fn()
+
+    try:
+        CACHE_DIR.mkdir(parents=True, exist_ok=True)
+        tmp_path = path.with_suffix(".tmp")
+        with tmp_path.open("wb") as f:
+            pickle.dump(value, f)
+        tmp_path.replace(path)
+    except (OSError, pickle.PickleError):
+        pass
+
+    return value
@@ -0,0 +1,26 @@
+"""
+Thin JSON shim: orjson when available, stdlib json otherwise.
+
+orjson serializes/deserializes several times faster than stdlib and
+returns bytes directly, which suits the framed MCP write path. The
+fallback keeps the same bytes-in/bytes-out contract so callers never
+care which implementation is active.
+"""
+
+try:
+    import orjson as _orjson
+
+    def dumps(obj) -> bytes:
+        return _orjson.dumps(obj)
+
+    def loads(data):
+        return _orjson.loads(data)
+
+except ImportError:
+    import json as _json
+
+    def dumps(obj) -> bytes:
+        return _json.dumps(obj).encode("utf-8")
+
+    def loads(data):
+        return _json.loads(data)
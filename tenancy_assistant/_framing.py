@@ -0,0 +1,56 @@
+"""
+Length-prefixed message framing for the MCP stdio protocol.
+
+Each message is `Content-Length: N\r\n\r\n` followed by exactly N bytes of
+JSON (the LSP/MCP convention). The reader knows exactly how many bytes to
+consume and parses once, instead of buffering and splitting an entire
+stdout capture, and stray text on the pipe can no longer corrupt parsing.
+"""
+
+try:
+    from . import _fastjson
+except ImportError:  # imported as a top-level module from a script
+    import _fastjson
+
+
+def encode_frame(obj) -> bytes:
+    """
+    Serialize `obj` as JSON and return it as one framed message.
+    """
+    body = _fastjson.dumps(obj)
+    return f"Content-Length: {len(body)}\r\n\r\n".encode("ascii") + body
+
+
+def write_frame(stream, obj) -> None:
+    """
+    Write `obj` as one framed message to a binary stream, then flush.
+    """
+    stream.write(encode_frame(obj))
+    stream.flush()
+
+
+def read_frame(stream):
+    """
+    Read one framed JSON message from a binary stream.
+
+    Returns the decoded object, or None on EOF. Raises ValueError if the
+    header block is malformed.
+    """
+    content_length = None
+    while True:
+        line = stream.readline()
+        if not line:
+            return None
+        line = line.strip()
+        if not line:
+            break
+        if line.lower().startswith(b"content-length:"):
+            content_length = int(line.split(b":", 1)[1])
+
+    if content_length is None:
+        raise ValueError("Missing Content-Length header in framed message.")
+
+    body = stream.read(content_length)
+    if len(body) < content_length:
+        return None
+    return _fastjson.loads(body)
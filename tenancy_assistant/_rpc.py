@@ -0,0 +1,193 @@
+"""
+Asyncio-backed JSON-RPC client for the MCP server subprocess.
+
+One long-lived background event loop thread owns a single
+asyncio.subprocess MCP server. Each call writes a framed request and
+parks a Future keyed by JSON-RPC id; a single reader task resolves
+futures as framed responses arrive. Concurrent callers (e.g. the three
+parallel snapshot preloads) therefore share one server process and can
+have many requests in flight at once, instead of each tying up a thread
+on its own blocking pipe read.
+"""
+
+import asyncio
+import logging
+import sys
+import threading
+from pathlib import Path
+
+from . import _fastjson, _framing
+
+logger = logging.getLogger(__name__)
+
+# Hard cap on any single MCP call. The EOF path only covers a server that
+# closes its pipes; a server that wedges with the pipes open would
+# otherwise block the caller forever, so on timeout the process is killed
+# and the next call respawns it.
+MCP_SERVER_TIMEOUT_SEC = 600
+
+
+class _AsyncMCPClient:
+    """
+    All methods run on the background event loop thread; use the
+    module-level `call()` shim from synchronous code.
+    """
+
+    def __init__(self):
+        self._proc = None
+        self._pending = {}
+        self._next_id = 0
+        self._spawn_lock = None
+
+    async def call(self, method: str, params: dict) -> dict:
+        if self._spawn_lock is None:
+            self._spawn_lock = asyncio.Lock()
+        async with self._spawn_lock:
+            await self._ensure_process()
+            proc = self._proc
+            self._next_id += 1
+            req_id = self._next_id
+
+        request = {
+            "jsonrpc": "2.0",
+            "id": req_id,
+            "method": method,
+            "params": params,
+        }
+
+        future = asyncio.get_running_loop().create_future()
+        self._pending[req_id] = future
+
+        try:
+            proc.stdin.write(_framing.encode_frame(request))
+            await proc.stdin.drain()
+        except (BrokenPipeError, ConnectionResetError, OSError) as e:
+            self._pending.pop(req_id, None)
+            if self._proc is proc:
+                self._proc = None
+            raise RuntimeError(f"MCP server pipe closed unexpectedly: {e}")
+
+        try:
+            response = await asyncio.wait_for(future, MCP_SERVER_TIMEOUT_SEC)
+        except asyncio.TimeoutError:
+            self._pending.pop(req_id, None)
+            if self._proc is proc:
+                self._proc = None
+            if proc.returncode is None:
+                proc.kill()
+            raise RuntimeError(
+                f"MCP call {method!r} timed out after {MCP_SERVER_TIMEOUT_SEC}s; "
+                "server restarted."
+            )
+
+        if "error" in response:
+            raise RuntimeError(f"MCP server returned error: {response['error']}")
+
+        return response["result"]
+
+    async def _ensure_process(self):
+        if self._proc is not None and self._proc.returncode is None:
+            return
+
+        server_path = Path(__file__).with_name("mcp_server.py")
+        if not server_path.exists():
+            raise RuntimeError(f"MCP server not found at {server_path}")
+
+        self._proc = await asyncio.create_subprocess_exec(
+            sys.executable,
+            "-u",
+            str(server_path),
+            stdin=asyncio.subprocess.PIPE,
+            stdout=asyncio.subprocess.PIPE,
+            stderr=asyncio.subprocess.PIPE,
+        )
+        asyncio.ensure_future(self._read_responses(self._proc))
+        asyncio.ensure_future(self._drain_stderr(self._proc))
+
+    async def _read_responses(self, proc):
+        """
+        Single reader loop: parse framed responses off stdout and complete
+        the matching pending future. On EOF, fail whatever is in flight so
+        the next call respawns the server.
+        """
+        try:
+            while True:
+                content_length = None
+                while True:
+                    line = await proc.stdout.readline()
+                    if not line:
+                        raise EOFError
+                    line = line.strip()
+                    if not line:
+                        break
+                    if line.lower().startswith(b"content-length:"):
+                        content_length = int(line.split(b":", 1)[1])
+
+                if content_length is None:
+                    continue
+
+                body = await proc.stdout.readexactly(content_length)
+                response = _fastjson.loads(body)
+
+                future = self._pending.pop(response.get("id"), None)
+                if future is not None and not future.done():
+                    future.set_result(response)
+        except (EOFError, asyncio.IncompleteReadError, ValueError):
+            if self._proc is proc:
+                self._proc = None
+            error = RuntimeError("MCP server closed its stdout.")
+            for future in self._pending.values():
+                if not future.done():
+                    future.set_exception(error)
+            self._pending.clear()
+
+    @staticmethod
+    async def _drain_stderr(proc):
+        """
+        Drain stderr continuously for the process lifetime so heavy server
+        logging can never fill the 64 KB pipe buffer and stall the server
+        mid-request; lines go to the 'tenancy_assistant._rpc' logger at
+        DEBUG rather than being buffered or re-printed unconditionally.
+        """
+        while True:
+            line = await proc.stderr.readline()
+            if not line:
+                break
+            logger.debug("mcp_server: %s", line.decode(errors="replace").rstrip())
+
+
+_loop = None
+_client = None
+_loop_lock = threading.Lock()
+
+
+def _ensure_loop():
+    global _loop, _client
+    with _loop_lock:
+        if _loop is None:
+            _loop = asyncio.new_event_loop()
+            threading.Thread(
+                target=_loop.run_forever, name="mcp-rpc-loop", daemon=True
+            ).start()
+            _client = _AsyncMCPClient()
+    return _loop
+
+
+async def call_async(method: str, params: dict) -> dict:
+    """
+    Issue a JSON-RPC call on the shared MCP server from async code
+    already running on the RPC event loop.
+    """
+    return await _client.call(method, params)
+
+
+def call(method: str, params: dict) -> dict:
+    """
+    Synchronous shim: schedule the call on the background event loop and
+    block the calling thread until the response arrives. Multiple threads
+    may call this concurrently; their requests pipeline over one server.
+    """
+    loop = _ensure_loop()
+    return asyncio.run_coroutine_threadsafe(
+        _client.call(method, params), loop
+    ).result()
@@ -1,12 +1,18 @@
+import asyncio
+import copy
+import functools
+import hashlib
 import os
+import re
 import sys
+import time
 import json
-import subprocess
-from pathlib import Path
 from typing import Dict, Any
 
 import oci
 
+from . import _digest, _disk_cache, _fastjson, _rpc
+
 
 # =========================
 # 1. OCI GEN AI CLIENT SETUP
@@ -30,9 +36,6 @@ GENAI_MODEL_ID = os.environ.get(
     "",
 )
 
-MCP_SERVER_TIMEOUT_SEC = 600
-
-
 def _require_env(name: str, value: str) -> str:
     if not value:
         raise RuntimeError(
@@ -41,41 +44,53 @@ def _require_env(name: str, value: str) -> str:
     return value
 
 
+@functools.lru_cache(maxsize=1)
+def _load_oci_config() -> Dict[str, Any]:
+    """
+    Load the OCI SDK config exactly once per process.
+
+    OCI_CONFIG_JSON (a JSON object with the usual config keys) skips disk
+    entirely, which suits container deploys; otherwise the config file is
+    read and parsed a single time instead of on every client construction.
+    """
+    config_json = os.environ.get("OCI_CONFIG_JSON")
+    if config_json:
+        config = json.loads(config_json)
+        oci.config.validate_config(config)
+        return config
+
+    return oci.config.from_file(
+        os.environ.get("OCI_CONFIG_FILE", "~/.oci/config"), GENAI_CONFIG_PROFILE
+    )
+
+
+@functools.lru_cache(maxsize=1)
 def get_genai_client() -> oci.generative_ai_inference.GenerativeAiInferenceClient:
     """
     Create an OCI Generative AI Inference client using the same pattern as your sample.
+    The client is built once and reused across chat calls, so repeated questions
+    skip config parsing and TLS/signer setup and benefit from HTTP keep-alive.
     """
     endpoint = _require_env("GENAI_ENDPOINT", GENAI_ENDPOINT)
-    config = oci.config.from_file("~/.oci/config", GENAI_CONFIG_PROFILE)
     client = oci.generative_ai_inference.GenerativeAiInferenceClient(
-        config=config,
+        config=_load_oci_config(),
         service_endpoint=endpoint,
         retry_strategy=oci.retry.NoneRetryStrategy(),
         timeout=(10, 240),
     )
     return client
 
-def genai_chat(client, prompt: str) -> str:
+@functools.lru_cache(maxsize=1)
+def _chat_templates():
     """
-    Send a single prompt to the OCI GenAI chat endpoint and return the text output.
-    This version is tailored to the response shape you showed.
+    Build the static parts of the chat payload once: sampling parameters,
+    serving mode, and compartment never change between calls, so env vars
+    are resolved and the OCI model objects allocated a single time.
     """
-    # Build the chat request
-    chat_detail = oci.generative_ai_inference.models.ChatDetails()
-
-    # Message content
-    content = oci.generative_ai_inference.models.TextContent()
-    content.text = prompt
-
-    message = oci.generative_ai_inference.models.Message()
-    message.role = "USER"
-    message.content = [content]
-
     chat_request = oci.generative_ai_inference.models.GenericChatRequest()
     chat_request.api_format = (
         oci.generative_ai_inference.models.BaseChatRequest.API_FORMAT_GENERIC
     )
-    chat_request.messages = [message]
     chat_request.max_tokens = 2048
     chat_request.temperature = 0.1  # low temp for deterministic JSON
     chat_request.frequency_penalty = 0
@@ -83,16 +98,57 @@ def genai_chat(client, prompt: str) -> str:
     chat_request.top_p = 1
     chat_request.top_k = 0
 
-    # On-demand serving mode with your model
-    model_id = _require_env("GENAI_MODEL_ID", GENAI_MODEL_ID)
-    compartment_id = _require_env("GENAI_COMPARTMENT_ID", GENAI_COMPARTMENT_ID)
+    chat_detail = oci.generative_ai_inference.models.ChatDetails()
     chat_detail.serving_mode = oci.generative_ai_inference.models.OnDemandServingMode(
-        model_id=model_id
+        model_id=_require_env("GENAI_MODEL_ID", GENAI_MODEL_ID)
     )
+    chat_detail.compartment_id = _require_env(
+        "GENAI_COMPARTMENT_ID", GENAI_COMPARTMENT_ID
+    )
+    return chat_detail, chat_request
+
+
+def _text_message(role: str, text: str):
+    content = oci.generative_ai_inference.models.TextContent()
+    content.text = text
+
+    message = oci.generative_ai_inference.models.Message()
+    message.role = role
+    message.content = [content]
+    return message
+
+
+def _build_chat_details(prompt: str, is_stream: bool = False, system: str = None):
+    """
+    Build the ChatDetails payload for a single-prompt chat call by
+    shallow-copying the prebuilt templates and attaching only the
+    per-call messages and stream flag. When `system` is given it goes in
+    a dedicated SYSTEM-role message ahead of the user prompt: the bytes
+    of that prefix are identical across calls, which lets the service
+    reuse its KV cache for the preamble instead of re-encoding it.
+    """
+    detail_template, request_template = _chat_templates()
+
+    messages = []
+    if system:
+        messages.append(_text_message("SYSTEM", system))
+    messages.append(_text_message("USER", prompt))
+
+    chat_request = copy.copy(request_template)
+    chat_request.messages = messages
+    chat_request.is_stream = is_stream
+
+    chat_detail = copy.copy(detail_template)
     chat_detail.chat_request = chat_request
-    chat_detail.compartment_id = compartment_id
+    return chat_detail
 
-    response = client.chat(chat_detail)
+
+def genai_chat(client, prompt: str, system: str = None) -> str:
+    """
+    Send a single prompt to the OCI GenAI chat endpoint and return the text output.
+    This version is tailored to the response shape you showed.
+    """
+    response = client.chat(_build_chat_details(prompt, system=system))
 
     # --- Extract text based on your actual shape ---
     data = response.data              # ChatResult
@@ -114,6 +170,26 @@ def genai_chat(client, prompt: str) -> str:
     return text_obj.text.strip()
 
 
+def genai_chat_stream(client, prompt: str, system: str = None):
+    """
+    Send a single prompt with is_stream=True and yield text chunks as they
+    arrive, so callers can render output at time-to-first-token instead of
+    waiting for the full completion.
+    """
+    response = client.chat(_build_chat_details(prompt, is_stream=True, system=system))
+
+    for event in response.data.events():
+        try:
+            chunk = json.loads(event.data)
+        except json.JSONDecodeError:
+            continue
+        contents = (chunk.get("message") or {}).get("content") or []
+        for part in contents:
+            text = part.get("text")
+            if text:
+                yield text
+
+
 
 # =========================
 # 2. CALL MCP SERVER (YOUR OCI TOOL)
@@ -121,48 +197,11 @@ def genai_chat(client, prompt: str) -> str:
 
 def call_mcp_server(method: str, params: Dict[str, Any]) -> Dict[str, Any]:
     """
-    Spawn the local mcp_server.py, send one JSON-RPC request via stdin,
-    read one JSON response from stdout, and return the 'result' dict.
-    """
-    request = {
-        "jsonrpc": "2.0",
-        "id": 1,
-        "method": method,
-        "params": params,
-    }
-
-    server_path = Path(__file__).with_name("mcp_server.py")
-    if not server_path.exists():
-        raise RuntimeError(f"MCP server not found at {server_path}")
-
-    proc = subprocess.Popen(
-        [sys.executable, str(server_path)],
-        stdin=subprocess.PIPE,
-        stdout=subprocess.PIPE,
-        stderr=subprocess.PIPE,
-        text=True,
-    )
-
-    stdout, stderr = proc.communicate(
-        json.dumps(request) + "\n", timeout=MCP_SERVER_TIMEOUT_SEC
-    )
-
-    if stderr:
-        print("=== MCP server stderr ===", file=sys.stderr)
-        print(stderr, file=sys.stderr)
-        print("=========================", file=sys.stderr)
-
-    stdout = stdout.strip()
-    if not stdout:
-        raise RuntimeError("No output from MCP server.")
-
-    last_line = [line for line in stdout.splitlines() if line.strip()][-1]
-    response = json.loads(last_line)
-
-    if "error" in response:
-        raise RuntimeError(f"MCP server returned error: {response['error']}")
-
-    return response["result"]
+    Send one JSON-RPC request to the shared, persistent mcp_server.py
+    subprocess and return the 'result' dict. Concurrent callers pipeline
+    their requests over the same server process (see _rpc).
+    """
+    return _rpc.call(method, params)
 
 def get_public_ip_summary(params: Dict[str, Any] = None) -> Dict[str, Any]:
     """
@@ -203,12 +242,85 @@ def get_cloud_guard_summary(params: Dict[str, Any] = None) -> Dict[str, Any]:
 # 3. TOOL SELECTION + ANSWERING LOGIC
 # =========================
 
-def decide_tool_and_args(client, question: str) -> Dict[str, Any]:
+# LLM outputs for a given input are cached on disk (see _disk_cache):
+# routing is essentially a pure function of the question phrasing, and a
+# final answer only changes when the underlying tool data changes. A cache
+# hit skips an entire GenAI round trip — the largest latency item in the
+# flow. `--no-cache` on the CLI disables this for debugging.
+_LLM_CACHE_TTL_SEC = 3600
+_llm_cache_enabled = True
+
+_QUESTION_PUNCT_RE = re.compile(r"[^\w\s]")
+
+
+def set_llm_cache_enabled(enabled: bool) -> None:
+    global _llm_cache_enabled
+    _llm_cache_enabled = bool(enabled)
+
+
+def _normalize_question(question: str) -> str:
     """
-    Ask the model (on OCI) which tool to call and with what arguments.
-    We use a strict JSON format to keep it model-agnostic.
+    Canonical cache form of a question: lowercase, punctuation stripped,
+    whitespace collapsed — so trivial rephrasings share a cache entry.
+    """
+    return " ".join(_QUESTION_PUNCT_RE.sub(" ", question.lower()).split())
+
+
+def _extract_json_object(text: str) -> str:
+    """
+    Extract the first balanced {...} block in one left-to-right pass,
+    tracking brace depth while respecting string literals and escapes —
+    so a '}' inside a quoted value can't truncate the object the way the
+    old find/rfind pair could. Raises ValueError if no object is found.
+    """
+    start = -1
+    depth = 0
+    in_string = False
+    escaped = False
+    for i, ch in enumerate(text):
+        if start == -1:
+            if ch == "{":
+                start = i
+                depth = 1
+            continue
+        if in_string:
+            if escaped:
+                escaped = False
+            elif ch == "\\":
+                escaped = True
+            elif ch == '"':
+                in_string = False
+        elif ch == '"':
+            in_string = True
+        elif ch == "{":
+            depth += 1
+        elif ch == "}":
+            depth -= 1
+            if depth == 0:
+                return text[start : i + 1]
+    raise ValueError("No balanced JSON object found in model output.")
+
+
+def decide_tool_and_args_cached(client, question: str) -> Dict[str, Any]:
     """
-    system_instructions = """
+    decide_tool_and_args behind the on-disk LLM cache, keyed on the
+    normalized question only (never the client object).
+    """
+    if not _llm_cache_enabled:
+        return decide_tool_and_args(client, question)
+
+    key = _disk_cache.make_key(
+        "decide_tool_and_args", {"question": _normalize_question(question)}
+    )
+    return _disk_cache.get_or_compute(
+        key, _LLM_CACHE_TTL_SEC, lambda: decide_tool_and_args(client, question)
+    )
+
+
+# System prompts live at module level so the exact same (frozen, interned)
+# preamble bytes go out on every call — a prerequisite for the service's
+# prefix/KV cache to kick in. Only the short user message varies per call.
+_ROUTER_SYSTEM = """
 You are an OCI Tenancy Assistant tool router.
 You MUST respond with a single JSON object ONLY, no extra text.
 
@@ -241,11 +353,6 @@ Your job:
 - For cost questions, use getCostSummary (default granularity MONTHLY, group_by COMPARTMENT).
 - For Cloud Guard questions, use getCloudGuardSummary; include_endpoints should be true if the user asks about endpoints.
 
-Example outputs:
-  { "tool": "getPublicIpSummary", "arguments": { "scope": "ALL" } }
-  { "tool": "getCostSummary", "arguments": { "granularity": "MONTHLY", "group_by": "COMPARTMENT" } }
-  { "tool": "getCloudGuardSummary", "arguments": { "include_endpoints": true, "max_problems": 10, "max_endpoints_per_problem": 10 } }
-
 If the user's question is NOT about any tool above, output:
   {
     "tool": null,
@@ -257,35 +364,57 @@ Rules:
 - No explanation, no markdown, no comments, no extra text.
 """
 
-    prompt = f"{system_instructions}\n\nUser question:\n{question}\n\nJSON output:"
+# Few-shot examples appended in strict mode only; non-strict callers save
+# the extra input tokens.
+_ROUTER_EXAMPLES = """
+Example outputs:
+  { "tool": "getPublicIpSummary", "arguments": { "scope": "ALL" } }
+  { "tool": "getCostSummary", "arguments": { "granularity": "MONTHLY", "group_by": "COMPARTMENT" } }
+  { "tool": "getCloudGuardSummary", "arguments": { "include_endpoints": true, "max_problems": 10, "max_endpoints_per_problem": 10 } }
+"""
 
-    raw = genai_chat(client, prompt).strip()
 
-    # Try direct JSON parse first
-    try:
-        data = json.loads(raw)
-    except json.JSONDecodeError:
-        # Attempt to extract the first { ... } block
-        start = raw.find("{")
-        end = raw.rfind("}")
-        if start != -1 and end != -1 and end > start:
-            snippet = raw[start : end + 1]
-            data = json.loads(snippet)
-        else:
-            raise
+def decide_tool_and_args(client, question: str, strict: bool = True) -> Dict[str, Any]:
+    """
+    Ask the model (on OCI) which tool to call and with what arguments.
+    We use a strict JSON format to keep it model-agnostic.
+    """
+    system = _ROUTER_SYSTEM + (_ROUTER_EXAMPLES if strict else "")
+    prompt = f"User question:\n{question}\n\nJSON output:"
+
+    raw = genai_chat(client, prompt, system=system).strip()
+
+    # Try direct parse first; if the model wrapped the JSON in prose (or
+    # the first character already rules out a bare object), fall back to
+    # extracting the first balanced { ... } block.
+    if raw.startswith("{"):
+        try:
+            data = _fastjson.loads(raw)
+        except ValueError:
+            data = _fastjson.loads(_extract_json_object(raw))
+    else:
+        data = _fastjson.loads(_extract_json_object(raw))
 
     tool = data.get("tool")
     arguments = data.get("arguments") or {}
     return {"tool": tool, "arguments": arguments}
 
 
-def answer_with_tool_result(
-    client, question: str, tool_name: str, tool_result: Dict[str, Any]
-) -> str:
+@functools.lru_cache(maxsize=64)
+def _digest_json_cached(tool_name: str, tool_json: bytes) -> str:
     """
-    Ask the model to write a nice explanation using the tool result JSON.
+    Digest a raw tool result (passed as its serialized bytes so the cache
+    key is its content) down to the compact JSON we embed in prompts.
+    Follow-up questions against the same snapshot reuse the digest.
     """
-    system_instructions = """
+    digest = _digest.digest_for_tool(tool_name, _fastjson.loads(tool_json))
+    return _fastjson.dumps(digest).decode()
+
+
+# Prompt skeletons are assembled once at import; each call fills in only
+# the question and the (memoized) digest instead of rebuilding a multi-KB
+# template string. The static instructions travel as the SYSTEM message.
+_ANSWER_SYSTEM = """
 You are an OCI Tenancy Assistant.
 You will be given:
 - A user question.
@@ -299,78 +428,373 @@ Your job:
 - Do NOT show the raw JSON. Summarize it instead.
 """
 
-    prompt = (
-        f"{system_instructions}\n\n"
-        f"User question:\n{question}\n\n"
-        f"Tool used: {tool_name}\n\n"
-        f"Tool JSON result:\n{json.dumps(tool_result, indent=2)}\n\n"
-        f"Answer:"
+_ANSWER_PROMPT = """User question:
+{question}
+
+Tool used: {tool_name}
+
+Tool JSON result:
+{data}
+
+Answer:"""
+
+
+def _build_answer_prompt(
+    question: str, tool_name: str, tool_result: Dict[str, Any]
+) -> str:
+    """
+    Build the answer prompt from a compact digest of the tool result JSON
+    (totals, histograms, top-k items) instead of the full payload, which
+    for Cloud Guard can be tens of KB of tokens.
+    """
+    return _ANSWER_PROMPT.format(
+        question=question,
+        tool_name=tool_name,
+        data=_digest_json_cached(tool_name, _fastjson.dumps(tool_result)),
+    )
+
+
+def answer_with_tool_result(
+    client, question: str, tool_name: str, tool_result: Dict[str, Any]
+) -> str:
+    """
+    Ask the model to write a nice explanation using the tool result digest.
+
+    Answers are served from the on-disk LLM cache when the same question
+    meets byte-identical tool data: the key is (tool name, sha256 of the
+    canonical result JSON, normalized question), so any change in the
+    underlying data forces a fresh completion.
+    """
+    compute = lambda: genai_chat(
+        client,
+        _build_answer_prompt(question, tool_name, tool_result),
+        system=_ANSWER_SYSTEM,
+    ).strip()
+
+    if not _llm_cache_enabled:
+        return compute()
+
+    result_sha = hashlib.sha256(
+        json.dumps(tool_result, sort_keys=True, default=str).encode()
+    ).hexdigest()
+    key = _disk_cache.make_key(
+        "answer_with_tool_result",
+        {
+            "tool": tool_name,
+            "result_sha256": result_sha,
+            "question": _normalize_question(question),
+        },
     )
+    return _disk_cache.get_or_compute(key, _LLM_CACHE_TTL_SEC, compute)
 
-    return genai_chat(client, prompt).strip()
 
-def chat_with_public_ip_using_cached_result(question: str, tool_result: Dict[str, Any]) -> str:
+def answer_with_tool_result_stream(
+    client, question: str, tool_name: str, tool_result: Dict[str, Any]
+):
+    """
+    Streaming variant of answer_with_tool_result: yields text chunks.
+    """
+    return genai_chat_stream(
+        client,
+        _build_answer_prompt(question, tool_name, tool_result),
+        system=_ANSWER_SYSTEM,
+    )
+
+def chat_with_public_ip_using_cached_result(
+    question: str, tool_result: Dict[str, Any], client=None
+) -> str:
     """
     Use OCI GenAI to answer a question using an ALREADY computed
     getPublicIpSummary JSON result (e.g., from cache).
     No MCP calls happen here.
     """
-    client = get_genai_client()
+    client = client or get_genai_client()
     return answer_with_tool_result(client, question, "getPublicIpSummary", tool_result)
 
-def chat_with_cost_using_cached_result(question: str, tool_result: Dict[str, Any]) -> str:
+def chat_with_cost_using_cached_result(
+    question: str, tool_result: Dict[str, Any], client=None
+) -> str:
     """
     Use OCI GenAI to answer a cost-related question using an ALREADY computed
     getCostSummary JSON result (e.g., from cache).
     """
-    client = get_genai_client()
+    client = client or get_genai_client()
     # We reuse the same answer_with_tool_result helper,
     # but pass the tool name "getCostSummary" so the prompt can mention "cost".
     return answer_with_tool_result(client, question, "getCostSummary", tool_result)
 
-def chat_with_cloud_guard_using_cached_result(question: str, tool_result: Dict[str, Any]) -> str:
+def chat_with_cloud_guard_using_cached_result(
+    question: str, tool_result: Dict[str, Any], client=None
+) -> str:
     """
     Use OCI GenAI to answer a Cloud Guard question using an ALREADY computed
     getCloudGuardSummary JSON result.
     """
-    client = get_genai_client()
+    client = client or get_genai_client()
     return answer_with_tool_result(client, question, "getCloudGuardSummary", tool_result)
 
 
+def stream_chat_with_public_ip_using_cached_result(
+    question: str, tool_result: Dict[str, Any], client=None
+):
+    """
+    Streaming variant of chat_with_public_ip_using_cached_result; yields
+    text chunks as they arrive from GenAI.
+    """
+    client = client or get_genai_client()
+    return answer_with_tool_result_stream(
+        client, question, "getPublicIpSummary", tool_result
+    )
 
-def chat_with_tenancy_assistant_oci(question: str) -> str:
+
+def stream_chat_with_cost_using_cached_result(
+    question: str, tool_result: Dict[str, Any], client=None
+):
+    """
+    Streaming variant of chat_with_cost_using_cached_result.
+    """
+    client = client or get_genai_client()
+    return answer_with_tool_result_stream(
+        client, question, "getCostSummary", tool_result
+    )
+
+
+def stream_chat_with_cloud_guard_using_cached_result(
+    question: str, tool_result: Dict[str, Any], client=None
+):
+    """
+    Streaming variant of chat_with_cloud_guard_using_cached_result.
+    """
+    client = client or get_genai_client()
+    return answer_with_tool_result_stream(
+        client, question, "getCloudGuardSummary", tool_result
+    )
+
+
+_UNIFIED_SECTION_LABELS = {
+    "getPublicIpSummary": "PUBLIC_IP_SUMMARY",
+    "getCostSummary": "COST_SUMMARY",
+    "getCloudGuardSummary": "CLOUD_GUARD_SUMMARY",
+}
+
+
+_UNIFIED_SYSTEM = """
+You are an OCI Tenancy Assistant.
+You will be given several labeled JSON summaries of the tenancy
+(public IPs, cost, Cloud Guard) followed by a user question.
+
+Your job:
+- Use whichever summaries are relevant to the question; ignore the rest.
+- Answer in clear, concise natural language.
+- Explicitly mention key numbers like total counts and breakdowns.
+- Do NOT show the raw JSON. Summarize it instead.
+"""
+
+_UNIFIED_PROMPT = """{sections}
+
+QUESTION:
+{question}
+
+Answer:"""
+
+
+def _build_unified_prompt(question: str, tool_results: Dict[str, Dict[str, Any]]) -> str:
+    """
+    Build one prompt carrying the digests of several tool results as
+    labeled context sections, so a multi-domain question ("how many IPs
+    and which compartment spends the most?") costs a single GenAI round
+    trip instead of one per tool.
+    """
+    sections = "\n".join(
+        f"{_UNIFIED_SECTION_LABELS.get(name, name)}: "
+        f"{_digest_json_cached(name, _fastjson.dumps(result))}"
+        for name, result in tool_results.items()
+    )
+
+    return _UNIFIED_PROMPT.format(sections=sections, question=question)
+
+
+def chat_unified(
+    question: str, tool_results: Dict[str, Dict[str, Any]], client=None
+) -> str:
+    """
+    Answer a question against several cached tool results (keyed by tool
+    name, e.g. "getPublicIpSummary") with a single GenAI call.
+    """
+    client = client or get_genai_client()
+    return genai_chat(
+        client, _build_unified_prompt(question, tool_results), system=_UNIFIED_SYSTEM
+    ).strip()
+
+
+def stream_chat_unified(
+    question: str, tool_results: Dict[str, Dict[str, Any]], client=None
+):
+    """
+    Streaming variant of chat_unified; yields text chunks.
+    """
+    client = client or get_genai_client()
+    return genai_chat_stream(
+        client, _build_unified_prompt(question, tool_results), system=_UNIFIED_SYSTEM
+    )
+
+
+
+# --------- SPECULATIVE TOOL EXECUTION ---------
+# The MCP call can't normally start until the LLM routing decision comes
+# back. For questions that clearly keyword-match one tool, we kick off the
+# likely call in parallel with the routing request and reuse its result if
+# the model agrees — hiding most of the tool latency behind LLM inference.
+
+_TOOL_GUESS_PATTERNS = (
+    (re.compile(r"public.?ip", re.IGNORECASE), "getPublicIpSummary"),
+    (re.compile(r"cost|spend|bill", re.IGNORECASE), "getCostSummary"),
+    (re.compile(r"cloud.?guard|threat", re.IGNORECASE), "getCloudGuardSummary"),
+)
+
+_SPECULATIVE_DEFAULT_ARGS = {
+    "getPublicIpSummary": {"scope": "ALL"},
+    "getCostSummary": {"granularity": "MONTHLY", "group_by": "COMPARTMENT"},
+    "getCloudGuardSummary": {},
+}
+
+_TOOL_RESULT_CACHE: Dict = {}
+_TOOL_RESULT_CACHE_TTL_SEC = 120
+
+
+def guess_tool(question: str):
     """
-    Full flow:
+    Cheap rule-based guess at which tool the router will pick, or None if
+    the question doesn't obviously match any tool.
+    """
+    for pattern, tool in _TOOL_GUESS_PATTERNS:
+        if pattern.search(question):
+            return tool
+    return None
+
+
+def _canonical_args(args) -> str:
+    return json.dumps(args or {}, sort_keys=True)
+
+
+def _call_mcp_cached(tool: str, args: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    call_mcp_server with a short-TTL result cache keyed on
+    (tool, canonical args), so a discarded speculation still pays off for
+    the next question that needs the same data.
+    """
+    key = (tool, _canonical_args(args))
+    entry = _TOOL_RESULT_CACHE.get(key)
+    if entry is not None and time.time() - entry[1] < _TOOL_RESULT_CACHE_TTL_SEC:
+        return entry[0]
+
+    result = call_mcp_server(tool, args)
+    _TOOL_RESULT_CACHE[key] = (result, time.time())
+    return result
+
+
+_DIRECT_SYSTEM = """
+You are an OCI Tenancy Assistant. The user will ask a question.
+Answer based on your general knowledge about OCI.
+If the question needs exact live tenancy data (counts, precise resource lists),
+say you don't have direct data access in this mode.
+"""
+
+
+def _answer_directly(client, question: str) -> str:
+    """
+    Answer without any tool data, from general OCI knowledge.
+    """
+    prompt = f"User question:\n{question}\n\nAnswer:"
+    return genai_chat(client, prompt, system=_DIRECT_SYSTEM)
+
+
+async def chat_with_tenancy_assistant_oci_async(question: str) -> str:
+    """
+    Full flow, async:
     1. Ask OCI GenAI which tool (if any) to call.
     2. If tool is chosen, call MCP server.
     3. Ask OCI GenAI to answer based on the JSON result.
+
+    Every blocking step (GenAI round trips, the MCP tool call) runs via
+    asyncio.to_thread, so a host serving many concurrent questions keeps
+    its event loop responsive while OCI work is in flight.
     """
-    client = get_genai_client()
+    client = await asyncio.to_thread(get_genai_client)
+
+    # Step 1: decide tool, with a speculative tool call racing the router.
+    guessed_tool = guess_tool(question)
+    speculative = None
+    if guessed_tool is not None:
+        speculative = asyncio.create_task(
+            asyncio.to_thread(
+                _call_mcp_cached, guessed_tool, _SPECULATIVE_DEFAULT_ARGS[guessed_tool]
+            )
+        )
 
-    # Step 1: decide tool
-    decision = decide_tool_and_args(client, question)
+    decision = await asyncio.to_thread(decide_tool_and_args_cached, client, question)
     tool = decision.get("tool")
     args = decision.get("arguments") or {}
 
+    speculation_hit = (
+        speculative is not None
+        and tool == guessed_tool
+        and _canonical_args(args) == _canonical_args(_SPECULATIVE_DEFAULT_ARGS[guessed_tool])
+    )
+    if speculative is not None and not speculation_hit:
+        # Wrong guess: let the call finish in the background (it still
+        # populates the short-TTL result cache) but ignore any failure.
+        speculative.add_done_callback(lambda t: t.exception())
+
     if not tool:
         # No tool needed; just answer generically
-        direct_system = """
-You are an OCI Tenancy Assistant. The user will ask a question.
-Answer based on your general knowledge about OCI.
-If the question needs exact live tenancy data (counts, precise resource lists),
-say you don't have direct data access in this mode.
-"""
-        prompt = f"{direct_system}\n\nUser question:\n{question}\n\nAnswer:"
-        return genai_chat(client, prompt)
+        return await asyncio.to_thread(_answer_directly, client, question)
 
     if tool not in ("getPublicIpSummary", "getCostSummary", "getCloudGuardSummary"):
         raise RuntimeError(f"Unknown tool requested by model: {tool}")
 
-    # Step 2: call MCP server with that tool
-    tool_result = call_mcp_server(tool, args)
+    # Step 2: call MCP server with that tool (requests from concurrent
+    # questions pipeline over the shared RPC loop; see _rpc). On a
+    # speculation hit the call already ran while the router was thinking.
+    if speculation_hit:
+        tool_result = await speculative
+    else:
+        tool_result = await asyncio.to_thread(_call_mcp_cached, tool, args)
 
     # Step 3: get final natural language answer
-    return answer_with_tool_result(client, question, tool, tool_result)
+    return await asyncio.to_thread(
+        answer_with_tool_result, client, question, tool, tool_result
+    )
+
+
+def chat_with_tenancy_assistant_oci(question: str) -> str:
+    """
+    Sync shim over chat_with_tenancy_assistant_oci_async for CLI use.
+    """
+    return asyncio.run(chat_with_tenancy_assistant_oci_async(question))
+
+
+def stream_chat_with_tenancy_assistant_oci(question: str):
+    """
+    Streaming variant of the full flow: yields answer text chunks as they
+    arrive from GenAI. Routing stays non-streaming (it needs the complete
+    JSON blob before parsing); only the final answer streams.
+    """
+    client = get_genai_client()
+
+    decision = decide_tool_and_args_cached(client, question)
+    tool = decision.get("tool")
+    args = decision.get("arguments") or {}
+
+    if not tool:
+        yield _answer_directly(client, question)
+        return
+
+    if tool not in ("getPublicIpSummary", "getCostSummary", "getCloudGuardSummary"):
+        raise RuntimeError(f"Unknown tool requested by model: {tool}")
+
+    tool_result = _call_mcp_cached(tool, args)
+    yield from answer_with_tool_result_stream(client, question, tool, tool_result)
 
 
 # =========================
@@ -378,22 +802,29 @@ say you don't have direct data access in this mode.
 # =========================
 
 def main():
-    if len(sys.argv) > 1:
-        question = " ".join(sys.argv[1:])
+    argv = sys.argv[1:]
+    if "--no-cache" in argv:
+        argv.remove("--no-cache")
+        set_llm_cache_enabled(False)
+
+    if argv:
+        question = " ".join(argv)
     else:
         question = input("Ask the OCI Tenancy Assistant a question: ")
 
     print(f"\n[QUESTION]\n{question}\n")
 
+    print("[ANSWER]\n")
     try:
-        answer = chat_with_tenancy_assistant_oci(question)
+        # Print chunks as GenAI produces them, so the first words appear at
+        # time-to-first-token instead of after the full completion.
+        for chunk in stream_chat_with_tenancy_assistant_oci(question):
+            print(chunk, end="", flush=True)
     except Exception as e:
-        print(f"[ERROR] {e}", file=sys.stderr)
+        print(f"\n[ERROR] {e}", file=sys.stderr)
         sys.exit(1)
 
-    print("[ANSWER]\n")
-    print(answer)
-    print()
+    print("\n")
 
 
 if __name__ == "__main__":
@@ -1,18 +1,63 @@
+import functools
+import operator
 import sys
 import json
+import threading
+import time
 import traceback
+import types
 import oci
+from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from datetime import datetime, timezone
 from oci.usage_api import models as usage_api_models
 
+try:
+    from . import _framing
+except ImportError:  # run directly as a script, not as a package module
+    import _framing
+
+try:
+    # Optional: vectorizes large cost aggregations when available. All
+    # call sites fall back to the pure-Python loop without it.
+    import numpy as np
+except ImportError:
+    np = None
+
 
 # Cache for compartment names so we don't call Identity over and over
 _COMPARTMENT_NAME_CACHE = {}
+_compartment_names_prefetched = False
+
+
+def prefetch_compartment_names(identity_client, tenancy_id: str) -> dict:
+    """
+    Warm _COMPARTMENT_NAME_CACHE with every compartment name in one bulk
+    paginated list_compartments call (plus get_tenancy for the root), so
+    a cost summary grouped by compartment never falls back to one
+    get_compartment round trip per bucket.
+    """
+    global _compartment_names_prefetched
+
+    names = {}
+    try:
+        for comp in list_all_compartments(identity_client, tenancy_id):
+            names[comp.id] = comp.name
+        _compartment_names_prefetched = True
+    except Exception:
+        pass  # resolve_compartment_name still works per-OCID
+
+    _COMPARTMENT_NAME_CACHE.update(names)
+    return names
+
 
-def resolve_compartment_name(identity_client, compartment_ocid: str) -> str:
+def resolve_compartment_name(client_factory, compartment_ocid: str) -> str:
     """
     Resolve a compartment OCID to a friendly name, with simple in-memory cache.
-    If resolution fails, we just return the OCID itself.
+    `client_factory` is a zero-argument callable returning an Identity
+    client; it is invoked only on a cache miss, so fully cached lookups
+    never touch Identity at all. If resolution fails, we just return the
+    OCID itself.
     """
     if not compartment_ocid:
         return "UNKNOWN"
@@ -21,7 +66,7 @@ def resolve_compartment_name(identity_client, compartment_ocid: str) -> str:
         return _COMPARTMENT_NAME_CACHE[compartment_ocid]
 
     try:
-        resp = identity_client.get_compartment(compartment_ocid)
+        resp = client_factory().get_compartment(compartment_ocid)
         name = resp.data.name
     except Exception:
         name = compartment_ocid  # fallback to OCID string
@@ -31,21 +76,80 @@ def resolve_compartment_name(identity_client, compartment_ocid: str) -> str:
 
 
 
+# ---------- JSON-RPC DISPATCH ----------
+
+# method name -> tool function (params, config) -> result dict
+_DISPATCH = {}
+
+
+def register(name):
+    """
+    Register a tool under its JSON-RPC method name. Tools self-register
+    at import, so adding one never touches handle_request, and the
+    lookup stays O(1) regardless of how many tools exist.
+    """
+
+    def wrap(fn):
+        _DISPATCH[name] = fn
+        return fn
+
+    return wrap
+
+
 # ---------- OCI CLIENT SETUP ----------
 
+# Clients are process-wide singletons per profile: each construction costs
+# config parsing plus signer/TLS setup, and a fresh client starts with a
+# cold connection pool. Reusing one instance keeps HTTPS connections warm
+# across requests. The SDK clients are thread-safe for the read-only calls
+# this server makes.
+
+def _pooled(client):
+    """
+    Tune the client's transport for fan-out: widen the urllib3 pool so
+    the 16-way compartment listings plus pipelined batch requests never
+    queue behind the requests default of 10 connections per host, and
+    retry transient gateway/throttle statuses with a short backoff at
+    the connection layer.
+    """
+    try:
+        from requests.adapters import HTTPAdapter
+        from urllib3.util.retry import Retry
+
+        adapter = HTTPAdapter(
+            pool_connections=64,
+            pool_maxsize=64,
+            max_retries=Retry(
+                total=3,
+                backoff_factor=0.2,
+                status_forcelist=[429, 500, 502, 503, 504],
+            ),
+        )
+        client.base_client.session.mount("https://", adapter)
+        client.base_client.session.mount("http://", adapter)
+    except Exception:
+        pass  # non-requests transport; pool tuning is best-effort
+    return client
+
+
+@functools.lru_cache(maxsize=4)
 def get_oci_client_config(profile_name: str = "DEFAULT"):
     return oci.config.from_file("~/.oci/config", profile_name)
 
 
-def get_identity_client(config):
-    return oci.identity.IdentityClient(config)
+@functools.lru_cache(maxsize=4)
+def get_identity_client(profile_name: str = "DEFAULT"):
+    return _pooled(oci.identity.IdentityClient(get_oci_client_config(profile_name)))
 
 
-def get_core_client(config):
-    return oci.core.VirtualNetworkClient(config)
+@functools.lru_cache(maxsize=4)
+def get_core_client(profile_name: str = "DEFAULT"):
+    return _pooled(oci.core.VirtualNetworkClient(get_oci_client_config(profile_name)))
 
-def get_cloud_guard_client(config):
-    return oci.cloud_guard.CloudGuardClient(config)
+
+@functools.lru_cache(maxsize=4)
+def get_cloud_guard_client(profile_name: str = "DEFAULT"):
+    return _pooled(oci.cloud_guard.CloudGuardClient(get_oci_client_config(profile_name)))
 
 
 def _isoformat(value):
@@ -54,77 +158,120 @@ def _isoformat(value):
     return value
 
 
+# Per-page record cap. Both Core list_public_ips and Identity
+# list_compartments accept up to 1000; the SDK default is far smaller,
+# which multiplies the number of round trips.
+_PAGE_LIMIT = 1000
+
+
+def _list_all_pages(list_call, **kwargs):
+    """
+    Yield every record from a paginated OCI list call.
+
+    Requests service-max pages (limit=1000) and prefetches the next page
+    on a worker thread while the caller consumes the current one, so
+    network I/O overlaps with Python-side result handling instead of
+    alternating with it the way list_call_get_all_results does.
+    """
+    with ThreadPoolExecutor(max_workers=1) as executor:
+        future = executor.submit(list_call, limit=_PAGE_LIMIT, **kwargs)
+        while future is not None:
+            response = future.result()
+            next_page = response.headers.get("opc-next-page")
+            if next_page:
+                future = executor.submit(
+                    list_call, limit=_PAGE_LIMIT, page=next_page, **kwargs
+                )
+            else:
+                future = None
+            yield from response.data
+
+
 def list_all_compartments(identity_client, tenancy_id):
     compartments = []
     tenancy = identity_client.get_tenancy(tenancy_id).data
     compartments.append(tenancy)
 
-    response = oci.pagination.list_call_get_all_results(
-        identity_client.list_compartments,
-        tenancy_id,
-        compartment_id_in_subtree=True,
-        access_level="ANY",
-        lifecycle_state=oci.identity.models.Compartment.LIFECYCLE_STATE_ACTIVE,
+    compartments.extend(
+        _list_all_pages(
+            identity_client.list_compartments,
+            compartment_id=tenancy_id,
+            compartment_id_in_subtree=True,
+            access_level="ANY",
+            lifecycle_state=oci.identity.models.Compartment.LIFECYCLE_STATE_ACTIVE,
+        )
     )
-    compartments.extend(response.data)
     return compartments
 
 
+@register("getPublicIpSummary")
 def tool_get_public_ip_summary(params, config):
     compartment_ocid = params.get("compartment_ocid")
     scope = (params.get("scope") or "ALL").upper()
 
-    identity_client = get_identity_client(config)
-    core_client = get_core_client(config)
+    core_client = get_core_client()
     tenancy_id = config["tenancy"]
 
     if compartment_ocid:
-        comp = identity_client.get_compartment(compartment_ocid).data
-        compartments = [comp]
+        # Only .id is consumed below, and the caller already gave us the
+        # OCID — a get_compartment round trip just to rewrap it is pure
+        # latency (and fails on compartments the caller can list but not
+        # read).
+        compartments = [types.SimpleNamespace(id=compartment_ocid)]
     else:
-        compartments = list_all_compartments(identity_client, tenancy_id)
+        compartments = list_all_compartments(get_identity_client(), tenancy_id)
+
+    def _list_compartment_public_ips(comp_id):
+        return list(
+            _list_all_pages(
+                core_client.list_public_ips,
+                scope="REGION",
+                compartment_id=comp_id,
+            )
+        )
 
-    total_count = 0
+    total_filtered = 0
     by_scope = {"EPHEMERAL": 0, "RESERVED": 0}
     items = []
-
-    for comp in compartments:
-        comp_id = comp.id
-
-        response = oci.pagination.list_call_get_all_results(
-            core_client.list_public_ips,
-            scope="REGION",
-            compartment_id=comp_id,
-        )
-
-        for ip in response.data:
-            lifetime = ip.lifetime
-            if lifetime == "EPHEMERAL":
-                by_scope["EPHEMERAL"] += 1
-            elif lifetime == "RESERVED":
-                by_scope["RESERVED"] += 1
-
-            total_count += 1
-            items.append({
-                "id": ip.id,
-                "ip_address": ip.ip_address,
-                "compartment_id": ip.compartment_id,
-                "lifetime": ip.lifetime,
-                "lifecycle_state": ip.lifecycle_state,
-                "assigned_entity_id": ip.assigned_entity_id,
-            })
-
-    if scope in ("EPHEMERAL", "RESERVED"):
-        filtered_items = [i for i in items if i["lifetime"] == scope]
-        total_filtered = len(filtered_items)
-    else:
-        filtered_items = items
-        total_filtered = total_count
+    lifetime_filter = scope if scope in ("EPHEMERAL", "RESERVED") else None
+
+    # Each compartment listing is an independent OCI round trip, so fan
+    # them out across a thread pool: wall-clock drops from the sum of all
+    # calls to roughly the slowest one. The OCI SDK clients are
+    # thread-safe for these read-only list calls; the accounting below
+    # stays in this thread. Scope filtering happens right here in the
+    # producing loop — rejected IPs are counted for by_scope but never
+    # get a dict built or a second filtering pass.
+    with ThreadPoolExecutor(max_workers=16) as executor:
+        futures = [
+            executor.submit(_list_compartment_public_ips, comp.id)
+            for comp in compartments
+        ]
+        for future in as_completed(futures):
+            for ip in future.result():
+                lifetime = ip.lifetime
+                if lifetime == "EPHEMERAL":
+                    by_scope["EPHEMERAL"] += 1
+                elif lifetime == "RESERVED":
+                    by_scope["RESERVED"] += 1
+
+                if lifetime_filter is not None and lifetime != lifetime_filter:
+                    continue
+
+                total_filtered += 1
+                items.append({
+                    "id": ip.id,
+                    "ip_address": ip.ip_address,
+                    "compartment_id": ip.compartment_id,
+                    "lifetime": lifetime,
+                    "lifecycle_state": ip.lifecycle_state,
+                    "assigned_entity_id": ip.assigned_entity_id,
+                })
 
     return {
         "total_count": total_filtered,
         "by_scope": by_scope,
-        "items": filtered_items,
+        "items": items,
     }
 
 # ---------- CLOUD GUARD SUMMARY TOOL ------------------------------------------------------------------------------
@@ -137,6 +284,7 @@ def _clamp_int(value, default, min_value=1, max_value=100):
     return max(min_value, min(max_value, value))
 
 
+@register("getCloudGuardSummary")
 def tool_get_cloud_guard_summary(params, config):
     """
     Get Cloud Guard targets, problems, and optionally problem endpoints.
@@ -147,7 +295,7 @@ def tool_get_cloud_guard_summary(params, config):
       - max_problems (int, optional) : default 10 (only when include_endpoints=True)
       - max_endpoints_per_problem (int, optional) : default 10
     """
-    cloud_guard_client = get_cloud_guard_client(config)
+    cloud_guard_client = get_cloud_guard_client()
     compartment_id = params.get("compartment_ocid") or config["tenancy"]
     include_endpoints = bool(params.get("include_endpoints", False))
     max_problems = _clamp_int(params.get("max_problems", 10), 10)
@@ -253,13 +401,14 @@ def tool_get_cloud_guard_summary(params, config):
 
 # ---------- COST SUMMARY TOOL (USAGE API) ----------------------------------------------------------------------------------
 
-def get_usage_client(config):
+@functools.lru_cache(maxsize=4)
+def get_usage_client(profile_name: str = "DEFAULT"):
     """
     Create an OCI Usage API client using the correct SDK module path.
     Your environment exposes it as oci.usage_api.UsageapiClient.
     """
     from oci.usage_api import UsageapiClient
-    return UsageapiClient(config)
+    return _pooled(UsageapiClient(get_oci_client_config(profile_name)))
 
 
 def iso_now_utc():
@@ -286,6 +435,52 @@ def default_month_range():
 
 
 
+# In-memory TTL cache for Usage API responses. Identical cost windows
+# repeat constantly from the chat UI, and request_summarized_usages is
+# often the slowest OCI endpoint in the flow; closed windows are stable,
+# so serving them from memory for 15 minutes drops repeat queries to the
+# GenAI phrasing call alone.
+_USAGE_CACHE = {}
+_USAGE_CACHE_TTL_SEC = 900
+_USAGE_CACHE_MAX = 64
+_usage_cache_lock = threading.Lock()
+
+
+def _cached_summarized_usages(usage_client, details, cache_key):
+    """
+    request_summarized_usages behind the TTL cache. `cache_key` must
+    carry every request field that shapes the response: (tenancy, start,
+    end, granularity, group_by dimensions, compartment filter).
+    """
+    now = time.monotonic()
+    with _usage_cache_lock:
+        entry = _USAGE_CACHE.get(cache_key)
+        if entry is not None and now - entry[1] < _USAGE_CACHE_TTL_SEC:
+            return entry[0]
+
+    items = usage_client.request_summarized_usages(details).data.items
+
+    with _usage_cache_lock:
+        if len(_USAGE_CACHE) >= _USAGE_CACHE_MAX:
+            _USAGE_CACHE.clear()
+        _USAGE_CACHE[cache_key] = (items, now)
+    return items
+
+
+# Candidate attribute names per group_by dimension; the right one is
+# resolved once per response from the first record rather than via a
+# getattr cascade on every record.
+_GROUP_KEY_ATTRS = {
+    "COMPARTMENT": ("compartment_id", "compartmentId", "compartment_ocid"),
+    "SERVICE": ("service", "service_name", "serviceName"),
+    "RESOURCE": ("resource_id", "resourceId", "resource_ocid"),
+}
+
+# Below this row count the Python loop beats the array setup cost.
+_VECTORIZE_MIN_ROWS = 256
+
+
+@register("getCostSummary")
 def tool_get_cost_summary(params, config):
     """
     Get summarized cost from OCI Usage API.
@@ -310,7 +505,7 @@ def tool_get_cost_summary(params, config):
         ]
       }
     """
-    usage_client = get_usage_client(config)
+    usage_client = get_usage_client()
     tenancy_id = config["tenancy"]
 
     # --- Parse inputs ---
@@ -370,98 +565,114 @@ def tool_get_cost_summary(params, config):
         )
 
     # --- Call Usage API ---
-    response = usage_client.request_summarized_usages(details)
-    usages = response.data.items  # list of SummarizedUsages
+    # Windows ending today (or later) still include the accruing partial
+    # day and always go to the service; fully closed windows are stable
+    # and come from the TTL cache.
+    if time_end < normalize_to_utc_midnight(iso_now_utc()):
+        cache_key = (
+            tenancy_id,
+            time_start.isoformat(),
+            time_end.isoformat(),
+            granularity,
+            tuple(group_by_dim),
+            compartment_ocid,
+        )
+        usages = _cached_summarized_usages(usage_client, details, cache_key)
+    else:
+        usages = usage_client.request_summarized_usages(details).data.items
 
 
     total_cost = 0.0
-    buckets_by_key = {}
-    buckets_by_compartment_ocid = {}
-    currency = "USD"  # default; will be overwritten if present
-
-    # Identity client only needed if we group by compartment
-    identity_client = None
-    if group_by == "COMPARTMENT":
-        identity_client = get_identity_client(config)
-
-    for u in usages:
-        # Amount and currency
-        amount = getattr(u, "computed_amount", None)
-        if amount is None:
-            amount = getattr(u, "cost", 0.0)
-        currency = getattr(u, "currency", currency) or currency
-        total_cost += amount
-
-        if group_by == "COMPARTMENT":
-            # Many OCI SDKs expose these as attributes on the UsageSummary model
-            compartment_ocid = (
-                getattr(u, "compartment_id", None)
-                or getattr(u, "compartmentId", None)
-                or getattr(u, "compartment_ocid", None)
-            )
-            if not compartment_ocid:
-                compartment_ocid = "UNKNOWN"
-
-            buckets_by_compartment_ocid.setdefault(compartment_ocid, 0.0)
-            buckets_by_compartment_ocid[compartment_ocid] += amount
-
-        elif group_by == "SERVICE":
-            service_key = (
-                getattr(u, "service", None)
-                or getattr(u, "service_name", None)
-                or getattr(u, "serviceName", None)
-                or "UNKNOWN"
+    buckets = defaultdict(float)
+    currency = "USD"  # default; overwritten if the response carries one
+
+    # Identity is only consulted when grouping by compartment, and the
+    # bulk prefetch runs once per process: repeat cost queries resolve
+    # every label straight from the warm cache.
+    if group_by == "COMPARTMENT" and not _compartment_names_prefetched:
+        prefetch_compartment_names(get_identity_client(), tenancy_id)
+
+    if usages:
+        # Resolve the accessors once from the first record, then run the
+        # hot loop with bound attrgetters — no per-record getattr cascade.
+        first = usages[0]
+        currency = getattr(first, "currency", None) or currency
+
+        # Pick the accessor by attribute presence, never by the first
+        # record's value: computed_amount is legitimately None for
+        # periods with no usage, and attrgetter on an attribute the
+        # model lacks would raise mid-response.
+        if hasattr(first, "computed_amount"):
+            get_amount = operator.attrgetter("computed_amount")
+        elif hasattr(first, "cost"):
+            get_amount = operator.attrgetter("cost")
+        else:
+            get_amount = lambda u: getattr(u, "cost", None)
+
+        def extract_amount(u, _get=get_amount):
+            # Either amount attribute can legitimately be None (no usage
+            # in the period); coerce once here so the accumulators below
+            # never see anything but a float.
+            amt = _get(u)
+            return 0.0 if amt is None else float(amt)
+
+        get_key = None
+        for attr_name in _GROUP_KEY_ATTRS.get(group_by, ()):
+            if hasattr(first, attr_name):
+                get_key = operator.attrgetter(attr_name)
+                break
+
+        if get_key is None:
+            extract_key = lambda u: "UNKNOWN"
+        else:
+            extract_key = lambda u, _get=get_key: _get(u) or "UNKNOWN"
+
+        if np is not None and len(usages) >= _VECTORIZE_MIN_ROWS:
+            # Large (e.g. DAILY multi-month) responses: do the groupby
+            # sum as array math, which also releases the GIL for the
+            # other worker threads while it runs.
+            keys = [extract_key(u) for u in usages]
+            amts = np.fromiter(
+                (extract_amount(u) for u in usages),
+                dtype=np.float64,
+                count=len(usages),
             )
-            buckets_by_key.setdefault(service_key, 0.0)
-            buckets_by_key[service_key] += amount
-
-        elif group_by == "RESOURCE":
-            resource_key = (
-                getattr(u, "resource_id", None)
-                or getattr(u, "resourceId", None)
-                or getattr(u, "resource_ocid", None)
-                or "UNKNOWN"
+            total_cost = float(np.round(amts.sum(), 2))
+            unique_keys, inverse = np.unique(
+                np.asarray(keys, dtype=object), return_inverse=True
             )
-            buckets_by_key.setdefault(resource_key, 0.0)
-            buckets_by_key[resource_key] += amount
-
+            # Round the whole bucket vector in one ufunc call; the
+            # per-item round() below then has nothing left to change.
+            sums = np.round(np.bincount(inverse, weights=amts), 2)
+            buckets.update(zip(unique_keys.tolist(), sums.tolist()))
         else:
-            buckets_by_key.setdefault("UNKNOWN", 0.0)
-            buckets_by_key["UNKNOWN"] += amount
+            # Everything the loop body touches is a local (the accessor
+            # closures, the bucket dict), keeping CPython to fast
+            # LOAD_FAST lookups on the hot path.
+            _buckets = buckets
+            for u in usages:
+                amount = extract_amount(u)
+                _buckets[extract_key(u)] += amount
+                total_cost += amount
 
     # Build items list with labels
-    items = []
-
     if group_by == "COMPARTMENT":
-        for ocid_key, value in buckets_by_compartment_ocid.items():
-            # Try to get a friendly name directly from the UsageSummary if possible
-            # (this is per-usage, but we only need any one name per compartment;
-            # we will still fall back to IdentityClient if needed.)
-            label = None
-
-            # Try to get compartment_name from one of the usage records.
-            # Since we don't have direct access here, we rely on Identity for now.
-            if ocid_key != "UNKNOWN":
-                label = resolve_compartment_name(identity_client, ocid_key)
-            else:
-                label = "UNKNOWN"
-
-            items.append(
-                {
-                    "key": ocid_key,
-                    "label": label,
-                    "cost": round(value, 2),
-                }
-            )
+        items = [
+            {
+                "key": ocid_key,
+                "label": (
+                    resolve_compartment_name(get_identity_client, ocid_key)
+                    if ocid_key != "UNKNOWN"
+                    else "UNKNOWN"
+                ),
+                "cost": round(value, 2),
+            }
+            for ocid_key, value in buckets.items()
+        ]
     else:
-        for k, v in buckets_by_key.items():
-            items.append(
-                {
-                    "key": k,
-                    "label": k,
-                    "cost": round(v, 2),
-                }
-            )
+        items = [
+            {"key": k, "label": k, "cost": round(v, 2)} for k, v in buckets.items()
+        ]
 
     result = {
         "total_cost": round(total_cost, 2),
@@ -485,13 +696,8 @@ def handle_request(req: dict, config):
     req_id = req.get("id")
 
     try:
-        if method == "getPublicIpSummary":
-            result = tool_get_public_ip_summary(params, config)
-        elif method == "getCloudGuardSummary":
-            result = tool_get_cloud_guard_summary(params, config)
-        elif method == "getCostSummary":
-            result = tool_get_cost_summary(params, config)
-        else:
+        fn = _DISPATCH.get(method)
+        if fn is None:
             return {
                 "jsonrpc": "2.0",
                 "id": req_id,
@@ -501,6 +707,8 @@ def handle_request(req: dict, config):
                 },
             }
 
+        result = fn(params, config)
+
         return {
             "jsonrpc": "2.0",
             "id": req_id,
@@ -523,18 +731,49 @@ def handle_request(req: dict, config):
 def main():
     config = get_oci_client_config(profile_name="DEFAULT")
 
-    for line in sys.stdin:
-        line = line.strip()
-        if not line:
-            continue
-        try:
-            req = json.loads(line)
-        except json.JSONDecodeError:
-            continue
-
-        resp = handle_request(req, config)
-        sys.stdout.write(json.dumps(resp) + "\n")
-        sys.stdout.flush()
+    # stdout carries only framed JSON-RPC responses; anything else
+    # (tracebacks, diagnostics) must go to stderr.
+    stdin = sys.stdin.buffer
+    stdout = sys.stdout.buffer
+    stdout_lock = threading.Lock()
+
+    def respond(resp):
+        # One frame per write; the lock keeps concurrently finishing
+        # responses from interleaving. JSON-RPC ids match them back up.
+        with stdout_lock:
+            _framing.write_frame(stdout, resp)
+
+    def handle_and_respond(single_req):
+        respond(handle_request(single_req, config))
+
+    def gather_batch(futures):
+        respond([f.result() for f in futures])
+
+    # The read loop only frames bytes off the pipe; actual tool work runs
+    # on the pool, so a client that pipelines independent calls (e.g. the
+    # three snapshot preloads) sees max(t1, t2, t3) instead of t1+t2+t3.
+    with ThreadPoolExecutor(max_workers=8) as executor:
+        while True:
+            try:
+                req = _framing.read_frame(stdin)
+            except (ValueError, json.JSONDecodeError):
+                traceback.print_exc()
+                continue
+            if req is None:
+                break
+
+            if isinstance(req, list):
+                # JSON-RPC batch: fan the entries out across the pool and
+                # answer with one array once they all finish. The gather
+                # happens on its own thread so it never occupies a worker.
+                futures = [
+                    executor.submit(handle_request, r, config) for r in req
+                ]
+                threading.Thread(
+                    target=gather_batch, args=(futures,), daemon=True
+                ).start()
+            else:
+                executor.submit(handle_and_respond, req)
 
 
 if __name__ == "__main__":